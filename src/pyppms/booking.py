@@ -64,7 +64,7 @@ class PpmsBooking:
             log.error("Parsing booking response failed ({}), text was:\n{}", err, text)
             raise
 
-        log.trace(str(self))
+        log.trace("{}", self)
 
     # FIXME: date is of type datetime.datetime, NOT datetime.date !!!
     @classmethod
@@ -101,7 +101,7 @@ class PpmsBooking:
             )
             raise
 
-        log.trace(f"Created booking from runningsheet: {booking}")
+        log.trace("Created booking from runningsheet: {}", booking)
         return booking
 
     def starttime_fromstr(self, time_str, date=None):
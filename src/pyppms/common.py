@@ -2,8 +2,10 @@
 
 # pylint: disable-msg=fixme
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from time import time as timestamp_now
 import csv
+import re
 from io import StringIO
 
 from loguru import logger as log
@@ -11,6 +13,13 @@ from loguru import logger as log
 from .exceptions import NoDataError
 
 
+# mapping of the strings used by PUMAPI for booleans to their Python values:
+_BOOLEAN_VALUES = {"true": True, "false": False}
+
+# splitting the header line on commas while dropping the surrounding whitespace:
+_HEADER_SPLIT = re.compile(r"\s*,\s*")
+
+
 def process_response_values(values):
     """Process (in-place) a list of strings, remove quotes, detect boolean etc.
 
@@ -27,14 +36,9 @@ def process_response_values(values):
     None
         Nothing is returned, the list's element are processed in-place.
     """
-    # tell pylint that there is no real gain using enumerate here:
-    # pylint: disable-msg=consider-using-enumerate
-    for i in range(len(values)):
-        values[i] = values[i].strip('"')
-        if values[i] == "true":
-            values[i] = True
-        if values[i] == "false":
-            values[i] = False
+    for i, value in enumerate(values):
+        value = value.strip('"')
+        values[i] = _BOOLEAN_VALUES.get(value, value)
 
 
 def dict_from_single_response(text, graceful=True):
@@ -145,13 +149,16 @@ def parse_multiline_response(text, graceful=True):
                 raise NoDataError("Invalid response format!")
             return []
 
-        header = lines[0].split(",")
-        for i, entry in enumerate(header):
-            header[i] = entry.strip()
+        header = _HEADER_SPLIT.split(lines[0].strip())
 
         lines_max = lines_min = len(header)
         for line in lines[1:]:
-            data = line.split(",")
+            if not line.strip():
+                log.debug("Skipping empty line in response.")
+                continue
+            # parse every line on its own, so an unbalanced quote can't make the csv
+            # reader consume the subsequent lines as part of the same record:
+            data = next(csv.reader([line], delimiter=","))
             process_response_values(data)
             lines_max = max(lines_max, len(data))
             lines_min = min(lines_min, len(data))
@@ -204,9 +211,10 @@ def time_rel_to_abs(minutes_from_now):
     datetime
         The absolute time point as a datetime object.
     """
-    now = datetime.now().replace(second=0, microsecond=0)
-    abstime = now + timedelta(minutes=int(minutes_from_now))
-    return abstime
+    # do the math on integer minutes since the epoch, this also takes care of
+    # dropping the seconds and microseconds from the current time:
+    now_min = int(timestamp_now()) // 60
+    return datetime.fromtimestamp((now_min + int(minutes_from_now)) * 60)
 
 
 def fmt_time(time):
@@ -12,6 +12,7 @@ import os
 import os.path
 import shutil
 from io import open
+from time import monotonic
 
 import requests
 from loguru import logger as log
@@ -22,6 +23,39 @@ from .system import PpmsSystem
 from .booking import PpmsBooking
 from .exceptions import NoDataError
 
+# read-only actions whose responses may be memoized (bookings and the runningsheet are
+# left out on purpose as they change over time without any interaction from pyppms,
+# `getsystems` as its parsed result is kept in `PpmsConnection.systems` anyway):
+_MEMOIZED_ACTIONS = frozenset(
+    [
+        "getadmins",
+        "getgroup",
+        "getgroups",
+        "getgroupusers",
+        "getsysrights",
+        "getuser",
+        "getuserexp",
+        "getusers",
+    ]
+)
+
+# read-only actions that are not memoized but also don't invalidate the memo:
+_VOLATILE_ACTIONS = frozenset(
+    ["auth", "getbooking", "getrunningsheet", "getsystems", "nextbooking"]
+)
+
+# memoized actions whose responses are affected by a modifying action, any modifying
+# action not listed here will clear all memoized responses (responses filtered by a
+# parameter the modifying action sets to a different value, e.g. `getuser` for another
+# `login`, are kept):
+_MEMO_INVALIDATIONS = {
+    # creating a user also creates its group in case it doesn't exist yet:
+    "newuser": frozenset(
+        ["getgroup", "getgroups", "getgroupusers", "getuser", "getusers"]
+    ),
+    "setright": frozenset(["getsysrights", "getuserexp"]),
+}
+
 
 class PpmsConnection:
 
@@ -34,7 +68,10 @@ class PpmsConnection:
     api_key : str
         The API key used for authenticating against the PUMAPI.
     timeout : float
-        The timeout value used in the ``requests.post`` calls.
+        The timeout value used in the POST requests to the PUMAPI.
+    http_session : requests.Session
+        The session used for talking to the PUMAPI, re-using the underlying
+        connection for subsequent requests.
     cache_path : str
         A path to a local directory used for caching responses.
     cache_users_only : bool
@@ -42,6 +79,17 @@ class PpmsConnection:
         on-disk cache, nothing else.
     last_served_from_cache : bool
         Indicates if the last request was served from the cache or on-line.
+    memoize : bool
+        Flag indicating that responses of read-only requests are kept in memory
+        and re-used for identical requests during the object's lifetime.
+    memo_ttl : float or None
+        The number of seconds after which a memoized response expires, `None` to
+        keep memoized responses until they get invalidated.
+    response_memo : dict
+        A dict mapping the action and parameters of a request to a tuple with the
+        (monotonic) time the response was received and the response itself,
+        filled (and used) only if `memoize` is enabled. Entries affected by a
+        request modifying PPMS are dropped when such a request is submitted.
     users : dict
         A dict with usernames as keys, mapping to the related
         :py:class:`pyppms.user.PpmsUser` object, serves as a cache during the object's
@@ -60,7 +108,16 @@ class PpmsConnection:
         ``auth_httpstatus``
     """
 
-    def __init__(self, url, api_key, timeout=10, cache="", cache_users_only=False):
+    def __init__(  # pylint: disable-msg=too-many-arguments
+        self,
+        url,
+        api_key,
+        timeout=10,
+        cache="",
+        cache_users_only=False,
+        memoize=False,
+        memo_ttl=None,
+    ):
         """Constructor for the PPMS connection object.
 
         Open a connection to the PUMAPI defined in `url` and try to authenticate
@@ -91,6 +148,15 @@ class PpmsConnection:
             This can be used in to speed up the slow requests (through the
             cache), while everything else will be handled through online
             requests. By default `False`.
+        memoize : bool, optional
+            If set to `True`, responses to read-only requests (like `getuser`)
+            will be kept in memory and re-used when the same request is
+            submitted again. Requests modifying PPMS (e.g. `setright`) will drop
+            the memoized responses they affect. By default `False`.
+        memo_ttl : float, optional
+            The number of seconds a memoized response may be re-used, by default
+            `None` which will keep it until it gets invalidated by a modifying
+            request.
 
         Raises
         ------
@@ -100,6 +166,7 @@ class PpmsConnection:
         self.url = url
         self.api_key = api_key
         self.timeout = timeout
+        self.http_session = requests.Session()
         self.users = {}
         self.fullname_mapping = {}
         self.systems = {}
@@ -112,6 +179,9 @@ class PpmsConnection:
         self.cache_users_only = cache_users_only
         self.last_served_from_cache = False
         """Indicates if the last request was served from the cache or on-line."""
+        self.memoize = memoize
+        self.memo_ttl = memo_ttl
+        self.response_memo = {}
 
         # run in cache-only mode (e.g. for testing or off-line usage) if no API
         # key has been specified, skip authentication then:
@@ -138,7 +208,7 @@ class PpmsConnection:
         )
         self.status["auth_state"] = "attempting"
         response = self.request("auth")
-        log.trace(f"Authenticate response: {response.text}")
+        log.trace("Authenticate response: {}", response.text)
         self.status["auth_response"] = response.text
         self.status["auth_httpstatus"] = response.status_code
 
@@ -193,9 +263,9 @@ class PpmsConnection:
             A dictionary with additional parameters to be submitted with the
             request.
         skip_cache : bool, optional
-            If set to True the request will NOT be served from the local cache,
-            independent whether a matching response file exists there, by
-            default False.
+            If set to True the request will NOT be served from the local cache
+            or the memoized responses, independent whether a matching response
+            exists there, by default False.
 
         Returns
         -------
@@ -211,6 +281,20 @@ class PpmsConnection:
         req_data.update(parameters)
         # log.debug("Request parameters: {}", parameters)
 
+        memo_key = None
+        if self.memoize:
+            if action in _MEMOIZED_ACTIONS:
+                memo_key = (action, tuple(sorted(parameters.items())))
+                if not skip_cache and memo_key in self.response_memo:
+                    received, response = self.response_memo[memo_key]
+                    if self.memo_ttl is None or monotonic() - received < self.memo_ttl:
+                        log.trace("Using memoized response for '{}'", action)
+                        self.last_served_from_cache = True
+                        return response
+                    log.trace("Memoized response for '{}' has expired", action)
+            elif action not in _VOLATILE_ACTIONS:
+                self.__invalidate_memo(action, parameters)
+
         response = None
         try:
             if skip_cache:  # pragma: no cover
@@ -218,8 +302,10 @@ class PpmsConnection:
             response = self.__intercept_read(req_data)
             self.last_served_from_cache = True
         except LookupError as err:
-            log.trace(f"Doing an on-line request: {err}")
-            response = requests.post(self.url, data=req_data, timeout=self.timeout)
+            log.trace("Doing an on-line request: {}", err)
+            response = self.http_session.post(
+                self.url, data=req_data, timeout=self.timeout
+            )
             self.last_served_from_cache = False
 
         # store the response if it hasn't been read from the cache before:
@@ -235,8 +321,55 @@ class PpmsConnection:
             log.error(msg)
             raise requests.exceptions.ConnectionError(msg)
 
+        if memo_key is not None:
+            self.response_memo[memo_key] = (monotonic(), response)
+
         return response
 
+    def __invalidate_memo(self, action, parameters):
+        """Drop the memoized responses affected by the given (modifying) action.
+
+        Parameters
+        ----------
+        action : str
+            The PUMAPI action about to be submitted.
+        parameters : dict
+            The parameters of the action, memoized responses of requests having a
+            different value for any of them (e.g. the `login` or system `id`) are
+            not affected and therefore kept.
+        """
+        affected = _MEMO_INVALIDATIONS.get(action)
+        if affected is None:
+            log.debug("Clearing all memoized responses (action '{}').", action)
+            self.response_memo.clear()
+            return
+
+        stale = [
+            (memo_action, memo_params)
+            for memo_action, memo_params in self.response_memo
+            if memo_action in affected
+            and not any(
+                name in parameters and str(parameters[name]) != str(value)
+                for name, value in memo_params
+            )
+        ]
+        log.debug("Dropping {} memoized responses (action '{}').", len(stale), action)
+        for key in stale:
+            del self.response_memo[key]
+
+    def __forget_memo(self, action):
+        """Drop all memoized responses of the given action.
+
+        Parameters
+        ----------
+        action : str
+            The PUMAPI action whose memoized responses should be dropped, making sure
+            the next request for it will be served from the on-disk cache or PUMAPI.
+        """
+        stale = [key for key in self.response_memo if key[0] == action]
+        for key in stale:
+            del self.response_memo[key]
+
     def __interception_path(self, req_data, create_dir=False):
         """Derive the path for a local cache file from a request's parameters.
 
@@ -257,32 +390,29 @@ class PpmsConnection:
         action = req_data["action"]
 
         if self.cache_users_only and action != "getuser":
-            log.trace(f"NOT caching '{action}' (cache_users_only is set)")
+            log.trace("NOT caching '{}' (cache_users_only is set)", action)
             return None
 
         intercept_dir = os.path.join(self.cache_path, action)
         if create_dir and not os.path.exists(intercept_dir):  # pragma: no cover
             try:
                 os.makedirs(intercept_dir)
-                log.trace(f"Created dir to store response: {intercept_dir}")
+                log.trace("Created dir to store response: {}", intercept_dir)
             except Exception as err:  # pylint: disable-msg=broad-except
                 log.warning(f"Failed creating [{intercept_dir}]: {err}")
                 return None
 
-        signature = ""
         # different python versions are returning dict items in different order, so
         # simply iterating over them will not always produce the same result - hence we
-        # build up a sorted list of keys first and use that one then:
-        keylist = list(req_data.keys())
-        keylist.sort()
-        for key in keylist:
-            if key in ["action", "apikey"]:
-                continue
-            signature += f"__{key}--{req_data[key]}"
+        # use the sorted keys (joining the parts once instead of appending repeatedly):
+        signature = "__".join(
+            f"{key}--{req_data[key]}"
+            for key in sorted(req_data)
+            if key not in ("action", "apikey")
+        )
         if signature == "":
-            signature = "__response"
-        signature = signature[2:] + ".txt"
-        intercept_file = os.path.join(intercept_dir, signature)
+            signature = "response"
+        intercept_file = os.path.join(intercept_dir, signature + ".txt")
         return intercept_file
 
     def __intercept_read(self, req_data):
@@ -319,11 +449,16 @@ class PpmsConnection:
             raise LookupError("No cache path configured")
 
         intercept_file = self.__interception_path(req_data, create_dir=False)
-        if not intercept_file or not os.path.exists(intercept_file):  # pragma: no cover
+        if not intercept_file:  # pragma: no cover
             raise LookupError(f"No cache hit for [{intercept_file}]")
 
-        with open(intercept_file, "r", encoding="utf-8") as infile:
-            text = infile.read()
+        # simply try to open the files instead of checking for their existence first,
+        # saving a `stat` call for every request:
+        try:
+            with open(intercept_file, "r", encoding="utf-8") as infile:
+                text = infile.read()
+        except FileNotFoundError as err:  # pragma: no cover
+            raise LookupError(f"No cache hit for [{intercept_file}]") from err
         log.debug(
             "Read intercepted response text from [{}]",
             intercept_file[len(str(self.cache_path)) :],
@@ -331,10 +466,12 @@ class PpmsConnection:
 
         status_code = 200
         status_file = os.path.splitext(intercept_file)[0] + "_status-code.txt"
-        if os.path.exists(status_file):
+        try:
             with open(status_file, "r", encoding="utf-8") as infile:
                 status_code = infile.read()
             log.debug(f"Read intercepted response status code from [{status_file}]")
+        except FileNotFoundError:
+            pass
         return PseudoResponse(text, status_code)
 
     def __intercept_store(self, req_data, response):  # pragma: no cover
@@ -387,12 +524,19 @@ class PpmsConnection:
         PUMAPI at the only cost of possibly having outdated information on
         *existing* users.
 
+        Memoized responses (see the `memoize` parameter of the constructor) are
+        always dropped, independent of the `keep_users` flag.
+
         Parameters
         ----------
         keep_users : bool, optional
             If set to `True` the `getuser` sub-directory in the cache location
             will be kept, by default `False`.
         """
+        if self.response_memo:
+            log.debug("Clearing {} memoized responses.", len(self.response_memo))
+            self.response_memo.clear()
+
         if self.cache_path == "":
             log.debug("No cache path configured, not flushing!")
             return
@@ -630,7 +774,7 @@ class PpmsConnection:
                 continue
 
             log.trace(
-                f"Booking for user '{self.fullname_mapping[full]}' ({full}) found"
+                "Booking for user '{}' ({}) found", self.fullname_mapping[full], full
             )
             system_name = entry["Object"]
             # FIXME: add a test with one system name being a subset of another system
@@ -718,6 +862,7 @@ class PpmsConnection:
             raise TypeError("`name_contains` must be a list of str, not str!")
 
         loc = localisation
+        loc_lower = loc.lower()
         loc_desc = f"with location matching [{localisation}]"
         if localisation == "":
             loc_desc = "(no location filter given)"
@@ -730,7 +875,7 @@ class PpmsConnection:
         system_ids = []
         systems = self.get_systems()
         for sys_id, system in systems.items():
-            if loc.lower() not in str(system.localisation).lower():
+            if loc_lower not in str(system.localisation).lower():
                 log.trace(
                     "System [{}] location ({}) is NOT matching ({}), ignoring",
                     system.name,
@@ -917,7 +1062,8 @@ class PpmsConnection:
         ----------
         force_refresh : bool, optional
             Re-request information from PPMS even if user details have been
-            cached locally before, by default False.
+            cached locally before (also ignoring a memoized list of users), by
+            default False.
         active_only : bool, optional
             If set to `False` also "inactive" users will be fetched from PPMS,
             by default `True`.
@@ -930,6 +1076,8 @@ class PpmsConnection:
         if self.users and not force_refresh:
             log.trace("Using cached details for {} users", len(self.users))
         else:
+            if force_refresh:
+                self.__forget_memo("getusers")
             self.update_users(active_only=active_only)
 
         return self.users
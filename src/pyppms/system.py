@@ -3,6 +3,8 @@
 # pylint: disable-msg=too-many-instance-attributes
 # pylint: disable-msg=too-many-arguments
 
+import sys
+
 from loguru import logger as log
 
 
@@ -43,6 +45,20 @@ class PpmsSystem:
         actually means - probably it refers to the "after hours" / "non-peak hours".
     """
 
+    __slots__ = (
+        "system_id",
+        "name",
+        "localisation",
+        "system_type",
+        "core_facility_ref",
+        "schedules",
+        "active",
+        "stats",
+        "bookable",
+        "autonomy_required",
+        "autonomy_required_after_hours",
+    )
+
     def __init__(self, details):
         """Initialize the system object.
 
@@ -58,8 +74,10 @@ class PpmsSystem:
             raise
 
         self.name = details["Name"]
-        self.localisation = details["Localisation"]
-        self.system_type = details["Type"]
+        # rooms and system types are shared by many systems, so intern them to keep
+        # one object per distinct value:
+        self.localisation = sys.intern(str(details["Localisation"]))
+        self.system_type = sys.intern(str(details["Type"]))
         self.core_facility_ref = details["Core facility ref"]
         self.schedules = details["Schedules"]
         self.active = details["Active"]
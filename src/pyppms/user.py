@@ -1,5 +1,7 @@
 """Module representing user objects in PPMS."""
 
+import sys
+
 from loguru import logger as log
 
 from .common import dict_from_single_response
@@ -24,6 +26,8 @@ class PpmsUser:
         The ``active`` state of the user account in PPMS, by default True.
     """
 
+    __slots__ = ("username", "email", "active", "ppms_group", "fullname")
+
     def __init__(self, response_text):
         """Initialize the user object.
 
@@ -34,11 +38,14 @@ class PpmsUser:
         """
         details = dict_from_single_response(response_text, graceful=True)
 
-        self.username = str(details["login"])
+        # usernames end up as keys / values in several lookup dicts and group names are
+        # shared by many users, so intern them to keep one object per distinct value:
+        self.username = sys.intern(str(details["login"]))
         self.email = str(details["email"])
         self.active = details["active"]
-        self.ppms_group = details["unitlogin"]
-        self._fullname = f'{details["lname"]} {details["fname"]}'
+        self.ppms_group = sys.intern(str(details["unitlogin"]))
+        fullname = f'{details["lname"]} {details["fname"]}'
+        self.fullname = fullname if fullname else self.username
 
         log.trace(
             "PpmsUser initialized: username=[{}], email=[{}], ppms_group=[{}], "
@@ -46,25 +53,10 @@ class PpmsUser:
             self.username,
             self.email,
             self.ppms_group,
-            self._fullname,
+            self.fullname,
             self.active,
         )
 
-    @property
-    def fullname(self):
-        """The user's full name, falling back to the username if empty.
-
-        Returns
-        -------
-        str
-            The full name ("<LASTNAME> <GIVENNAME>") of the user in PPMS, or the
-            user accocunt name if the former one is empty.
-        """
-        if self._fullname == "":
-            return self.username
-
-        return self._fullname
-
     def details(self):
         """Generate a string with details on the user object."""
         return (
@@ -2,6 +2,9 @@
 
 # pylint: disable-msg=fixme
 
+import csv
+from io import StringIO
+
 import pytest
 
 from loguru import logger
@@ -94,14 +97,20 @@ def extend_raw_details(raw_details):
         "active: True"
     )
 
-    details["api_response"] = (
-        "login,lname,fname,"
-        "email,phone,bcode,affiliation,"
-        "unitlogin,mustchpwd,mustchbcode,active\r\n"
-        f'"{details["login"]}","{details["lname"]}","{details["fname"]}",'
-        f'"{details["email"]}","{details["phone"]}","","",'
-        f'"{details["unitlogin"]}",false,false,true\r\n'
-    )
+    header = (
+        "login,lname,fname,email,phone,bcode,affiliation,"
+        "unitlogin,mustchpwd,mustchbcode,active"
+    ).split(",")
+    data = [details[key] for key in header[:5]] + ["", "", details["unitlogin"]]
+    data += ["false", "false", "true"]
+
+    # use the csv module to take care of quoting the values (like PUMAPI does, the
+    # header line is left unquoted), its default line terminator is "\r\n" (same as
+    # the one used by PUMAPI):
+    response = StringIO()
+    response.write(",".join(header) + "\r\n")
+    csv.writer(response, quoting=csv.QUOTE_ALL).writerow(data)
+    details["api_response"] = response.getvalue()
 
     return details
 
@@ -109,7 +118,7 @@ def extend_raw_details(raw_details):
 ### raw user dicts ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def user_details_raw():
     """A dict with default user details matching a parsed API response.
 
@@ -123,7 +132,7 @@ def user_details_raw():
     return __PPMS_VALUES__["user_standard"]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def user_admin_details_raw():
     """A dict with default admin-user details matching a parsed API response.
 
@@ -140,13 +149,13 @@ def user_admin_details_raw():
 ### extended user dicts (with keys 'fullname', 'api_response', 'expected') ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def user_details(user_details_raw):
     """A dict with extended user details."""
     return extend_raw_details(user_details_raw)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def user_admin_details(user_admin_details_raw):
     """A dict with extended administrator user details."""
     return extend_raw_details(user_admin_details_raw)
@@ -155,7 +164,7 @@ def user_admin_details(user_admin_details_raw):
 ### PpmsUser objects ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ppms_user(user_details):
     """Helper function to create a PpmsUser object with default values.
 
@@ -171,7 +180,7 @@ def ppms_user(user_details):
     return PpmsUser(user_details["api_response"])
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ppms_user_admin(user_admin_details):
     """Helper function to create a PpmsUser object of an administrator user.
 
@@ -190,7 +199,7 @@ def ppms_user_admin(user_admin_details):
 ### group details ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def group_details():
     """Helper function providing a dict with default group details.
 
@@ -204,7 +213,7 @@ def group_details():
 ### system detail dicts ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def system_details_raw():
     """A dict with default system details matching a parsed API response.
 
@@ -222,7 +231,7 @@ def system_details_raw():
 ### mapping dicts for user fullname, system name, ... ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def fullname_mapping(ppms_user, ppms_user_admin):
     """A dict to map user "fullnames" to login / account names."""
     mapping = {
@@ -232,7 +241,7 @@ def fullname_mapping(ppms_user, ppms_user_admin):
     return mapping
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def systemname_mapping(system_details_raw):
     """A dict to map the system name to its ID."""
     mapping = {system_details_raw["Name"]: int(system_details_raw["System id"])}
@@ -242,7 +251,7 @@ def systemname_mapping(system_details_raw):
 ### booking / runningsheet details ###
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def runningsheet_response():
     """Example response text of a 'getrunningsheet' request.
 
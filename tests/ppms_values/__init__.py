@@ -1,15 +1,23 @@
 """Load and return PPMS values from YAML."""
 
+from functools import cache
 from os.path import abspath, dirname, join
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
+
+@cache
 def values():
-    """Load YAML and return values."""
+    """Load YAML and return values (the file is parsed only once)."""
     settings_file = join(abspath(dirname(__file__)), "values.yml")
 
-    with open(settings_file, "r", encoding="utf-8") as infile:
-        settings = yaml.safe_load(infile)
+    # pass the raw bytes, libyaml detects the (UTF) encoding on its own:
+    with open(settings_file, "rb") as infile:
+        settings = yaml.load(infile, Loader=SafeLoader)
 
     return settings
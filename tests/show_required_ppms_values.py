@@ -7,28 +7,35 @@ from ppms_values import values
 
 ppms_values = values()
 
-print("\nThe following objects are required in your PPMS test-instance:\n")
-print("(NOTE: default values are mostly skipped here)\n\n")
-
-skipdefaults = [
-    "unitbcode",
-    "Autonomy Required",
-    "Autonomy Required After Hours",
-    "Stats",
-    "Schedules",
-    "Bookable",
-    "Core facility ref",
-    "System id",
-    "mustchbcode",
-    "mustchpwd",
-    "affiliation",
-    "bcode",
-]
 
+skipdefaults = frozenset(
+    [
+        "unitbcode",
+        "Autonomy Required",
+        "Autonomy Required After Hours",
+        "Stats",
+        "Schedules",
+        "Bookable",
+        "Core facility ref",
+        "System id",
+        "mustchbcode",
+        "mustchpwd",
+        "affiliation",
+        "bcode",
+    ]
+)
+
+lines = [
+    "\nThe following objects are required in your PPMS test-instance:\n",
+    "(NOTE: default values are mostly skipped here)\n\n",
+]
 for ppms_type in ppms_values.keys():
-    print(f"#################### {ppms_type} ####################")
+    lines.append(f"#################### {ppms_type} ####################")
     for key, val in ppms_values[ppms_type].items():
         if key in skipdefaults:
             continue
-        print(f"  {key} -> {val}")
-    print("\n")
+        lines.append(f"  {key} -> {val}")
+    lines.append("\n")
+
+# assemble the output first and print it at once:
+print("\n".join(lines))
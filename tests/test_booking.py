@@ -15,12 +15,42 @@ TIME_START = datetime.now().strftime(FMT_TIME)
 TIME_END = (datetime.now() + timedelta(minutes=45)).strftime(FMT_TIME)
 START = f"{DAY} {TIME_START}"
 END = f"{DAY} {TIME_END}"
+START_DT = datetime.strptime(START, FMT)
 
 USERNAME = "ppmsuser"
 SYS_ID = "42"
 SESSION_ID = "some_session_id"
-EXPECTED = f"PpmsBooking(username=[{USERNAME}], system_id=[{SYS_ID}], "
-EXPECTED += f"starttime=[%s], endtime=[%s], session=[{SESSION_ID}])"
+TIME_DELTA = 45
+DEFAULT_RESPONSE = f"{USERNAME}\n{TIME_DELTA}\n{SESSION_ID}\n"
+
+
+def expected(start, end):
+    """Assemble the expected string representation of a booking.
+
+    Parameters
+    ----------
+    start : str
+        The formatted start time of the booking.
+    end : str
+        The formatted end time of the booking.
+
+    Returns
+    -------
+    str
+    """
+    return (
+        f"PpmsBooking(username=[{USERNAME}], system_id=[{SYS_ID}], "
+        f"starttime=[{start}], endtime=[{end}], session=[{SESSION_ID}])"
+    )
+
+
+class FrozenDatetime(datetime):
+    """A datetime class whose `now()` is frozen to the `START_DT` constant."""
+
+    @classmethod
+    def now(cls, tz=None):
+        """Return the frozen `START_DT`, converted to the given time zone (if any)."""
+        return datetime.fromtimestamp(START_DT.timestamp(), tz)
 
 
 def create_booking(
@@ -34,8 +64,9 @@ def create_booking(
     -------
     PpmsBooking
     """
-    time_delta = 45
-    response = f"{username}\n{time_delta}\n{session_id}\n"
+    response = DEFAULT_RESPONSE
+    if (username, session_id) != (USERNAME, SESSION_ID):
+        response = f"{username}\n{TIME_DELTA}\n{session_id}\n"
     return PpmsBooking(text=response, booking_type="get", system_id=system_id)
 
 
@@ -43,11 +74,11 @@ def test_ppmsbooking():
     """Test the PpmsBooking constructor."""
     # run constructor with 'system_id' being a str
     booking = create_booking()
-    assert str(booking) == EXPECTED % (START, END)
+    assert str(booking) == expected(START, END)
 
     # run constructor with 'system_id' being an int
     booking = create_booking(system_id=42)
-    assert str(booking) == EXPECTED % (START, END)
+    assert str(booking) == expected(START, END)
 
     # run constructor with 'system_id' being something not int-like
     with pytest.raises(ValueError):
@@ -59,13 +90,13 @@ def test_starttime_fromstr__time():
     booking = create_booking()
 
     newtime = "12:45"
-    booking.starttime_fromstr(newtime, date=datetime.strptime(START, FMT))
+    booking.starttime_fromstr(newtime, date=START_DT)
 
     newstart = f"{DAY} {newtime}"
-    assert str(booking) == EXPECTED % (newstart, END)
+    assert str(booking) == expected(newstart, END)
 
 
-def test_starttime_fromstr__date():
+def test_starttime_fromstr__date(monkeypatch):
     """Test changing the starting date of a booking."""
     booking = create_booking()
 
@@ -75,12 +106,14 @@ def test_starttime_fromstr__date():
     booking.starttime_fromstr(newtime, startdate)
 
     newstart = f"{newdate} {newtime}"
-    assert str(booking) == EXPECTED % (newstart, END)
+    assert str(booking) == expected(newstart, END)
 
-    # test with date set to 'None' (resulting in current date to be used)
+    # test with date set to 'None' (resulting in current date to be used), using a
+    # frozen clock to prevent failures when the date changes during the test:
+    monkeypatch.setattr("pyppms.booking.datetime", FrozenDatetime)
     booking.starttime_fromstr(newtime, date=None)
-    newstart = f"{datetime.now().strftime(FMT_DATE)} {newtime}"
-    assert str(booking) == EXPECTED % (newstart, END)
+    newstart = f"{DAY} {newtime}"
+    assert str(booking) == expected(newstart, END)
 
 
 def test_endtime_fromstr__time():
@@ -88,13 +121,13 @@ def test_endtime_fromstr__time():
     booking = create_booking()
 
     newtime = "12:45"
-    booking.endtime_fromstr(newtime, date=datetime.strptime(START, FMT))
+    booking.endtime_fromstr(newtime, date=START_DT)
 
     newend = f"{DAY} {newtime}"
-    assert str(booking) == EXPECTED % (START, newend)
+    assert str(booking) == expected(START, newend)
 
 
-def test_endtime_fromstr__date():
+def test_endtime_fromstr__date(monkeypatch):
     """Test changing the ending date of a booking."""
     booking = create_booking()
 
@@ -104,12 +137,14 @@ def test_endtime_fromstr__date():
     booking.endtime_fromstr(newtime, enddate)
 
     newend = f"{newdate} {newtime}"
-    assert str(booking) == EXPECTED % (START, newend)
+    assert str(booking) == expected(START, newend)
 
-    # test with date set to 'None' (resulting in current date to be used)
+    # test with date set to 'None' (resulting in current date to be used), using a
+    # frozen clock to prevent failures when the date changes during the test:
+    monkeypatch.setattr("pyppms.booking.datetime", FrozenDatetime)
     booking.endtime_fromstr(newtime, date=None)
-    newend = f"{datetime.now().strftime(FMT_DATE)} {newtime}"
-    assert str(booking) == EXPECTED % (START, newend)
+    newend = f"{DAY} {newtime}"
+    assert str(booking) == expected(START, newend)
 
 
 def test_noendtime_str():
@@ -9,48 +9,59 @@ import pytest
 from pyppms import common
 
 
-def test_dict_from_single_response():
+VALID = 'one,two,thr,fou,fiv,six,sev\nasdf,"qwr",true,"true",false,,"false"'
+VALID_DICT = {
+    "one": "asdf",
+    "two": "qwr",
+    "thr": True,
+    "fou": True,
+    "fiv": False,
+    "six": "",
+    "sev": False,
+}
+VALID_GRACEFUL = VALID + "\nsomething in line three\nand four!"
+INVALID_HEADER = "zero," + VALID
+# surplus header fields are discarded from the end, shifting all keys by one:
+INVALID_HEADER_DICT = {
+    "zero": "asdf",
+    "one": "qwr",
+    "two": True,
+    "thr": True,
+    "fou": False,
+    "fiv": "",
+    "six": False,
+}
+INVALID_DATA = VALID + ',"eight"'
+
+
+@pytest.mark.parametrize(
+    "text,graceful,expected",
+    [
+        (VALID, False, VALID_DICT),  # valid input
+        ("\n\n", True, {"": ""}),  # empty input
+        (VALID_GRACEFUL, True, VALID_DICT),  # too many lines, otherwise valid
+        (INVALID_HEADER, True, INVALID_HEADER_DICT),  # too many header fields
+        (INVALID_DATA, True, VALID_DICT),  # too many data fields
+    ],
+)
+def test_dict_from_single_response(text, graceful, expected):
     """Test the two-line-response-to-dict converter."""
-    valid = 'one,two,thr,fou,fiv,six,sev\nasdf,"qwr",true,"true",false,,"false"'
-    valid_dict = {
-        "one": "asdf",
-        "two": "qwr",
-        "thr": True,
-        "fou": True,
-        "fiv": False,
-        "six": "",
-        "sev": False,
-    }
-
-    # testing valid input:
-    parsed = common.dict_from_single_response(valid, graceful=False)
-    assert parsed == valid_dict
-
-    # testing input with too few lines:
-    with pytest.raises(ValueError):
-        common.dict_from_single_response("\n", graceful=True)
-
-    # testing empty input:
-    assert common.dict_from_single_response("\n\n") == {"": ""}
-
-    # testing input with too many lines, otherwise valid:
-    valid_graceful = valid + "\nsomething in line three\nand four!"
-    with pytest.raises(ValueError):
-        common.dict_from_single_response(valid_graceful, graceful=False)
-    parsed = common.dict_from_single_response(valid_graceful, graceful=True)
-    assert parsed == valid_dict
-
-    # testing input with too many header fields:
-    invalid_header = "zero," + valid
-    parsed = common.dict_from_single_response(invalid_header, graceful=True)
+    assert common.dict_from_single_response(text, graceful=graceful) == expected
+
+
+@pytest.mark.parametrize(
+    "text,graceful",
+    [
+        ("\n", True),  # too few lines
+        (VALID_GRACEFUL, False),  # too many lines, otherwise valid
+        (INVALID_HEADER, False),  # too many header fields
+        (INVALID_DATA, False),  # too many data fields
+    ],
+)
+def test_dict_from_single_response__raises(text, graceful):
+    """Test the two-line-response-to-dict converter with invalid input."""
     with pytest.raises(ValueError):
-        common.dict_from_single_response(invalid_header, graceful=False)
-
-    # testing input with too many data fields:
-    invalid_data = valid + ',"eight"'
-    parsed = common.dict_from_single_response(invalid_data, graceful=True)
-    with pytest.raises(ValueError):
-        common.dict_from_single_response(invalid_data, graceful=False)
+        common.dict_from_single_response(text, graceful=graceful)
 
 
 def test_process_response_values():
@@ -114,9 +125,36 @@ def test_parse_multiline_response():
     assert parsed[0].keys() == expected.keys()
 
 
-def test_time_rel_to_abs():
+def test_parse_multiline_response__quoted_comma():
+    """Test parsing quoted data fields containing the delimiter."""
+    text = 'foo,bar\n"some, more","thing"'
+    parsed = common.parse_multiline_response(text, graceful=False)
+    assert parsed == [{"foo": "some, more", "bar": "thing"}]
+
+
+def test_parse_multiline_response__unbalanced_quote():
+    """Test that an unbalanced quote doesn't swallow the subsequent lines."""
+    text = 'foo,bar\nsome,"thing,else\nother,"thing"'
+    parsed = common.parse_multiline_response(text, graceful=False)
+    assert parsed == [
+        {"foo": "some", "bar": "thing,else"},
+        {"foo": "other", "bar": "thing"},
+    ]
+
+
+def test_parse_multiline_response__blank_line():
+    """Test that empty data lines are skipped."""
+    text = "foo,bar\na,b\n\nc,d"
+    parsed = common.parse_multiline_response(text, graceful=False)
+    assert parsed == [{"foo": "a", "bar": "b"}, {"foo": "c", "bar": "d"}]
+
+
+def test_time_rel_to_abs(monkeypatch):
     """Test the relatitve-to-absolute timestamp converter function."""
-    expected = datetime.now().replace(second=0, microsecond=0)
+    # freeze the clock to avoid races when the minute rolls over during the test:
+    epoch = 1700000059.75
+    monkeypatch.setattr(common, "timestamp_now", lambda: epoch)
+    expected = datetime.fromtimestamp(epoch).replace(second=0, microsecond=0)
 
     converted = common.time_rel_to_abs(0)
     assert converted == expected
@@ -5,29 +5,54 @@
 
 import logging
 import os.path
+from copy import copy
 from datetime import datetime
-from shutil import rmtree, copytree
+from shutil import copytree
 
 import pyppmsconf
 import pytest
+import requests.adapters
 import requests.exceptions
 
 from loguru import logger as log
 
+from ppms_values import values
 from pyppms import ppms
 
 # TODO: system ID is hard-coded here, so this will fail on any other instance!
 __SYS_ID__ = 69
 
+# cached response files (per request type) the cache-flushing tests rely on, all other
+# request sub-directories of a test-cache are created empty:
+__KEEP_FILES__ = {"getuser": ["login--pyppms.txt", "login--pyppms-adm.txt"]}
 
-@pytest.fixture
-def ppms_connection(caplog):
-    """Establish a connection to a PPMS / PUMAPI instance."""
+# an arbitrary date long time in the future for the runningsheet tests (unfortunately
+# the web interface of PPMS doesn't let us go much beyond 10 years from now), that day
+# is expected to have four 60-minute-bookings, starting at the full hour - mapping
+# their start times to their end times:
+__RS_DAY__ = datetime(2028, 12, 24)
+__RS_SESSIONS__ = {
+    __RS_DAY__.replace(hour=shour): __RS_DAY__.replace(hour=shour + 1)
+    for shour in [9, 11, 13, 15]
+}
+
+# details of the system used by the parametrized tests (see `ppms_values/values.yml`):
+__SYSTEM__ = values()["system"]
+
+
+@pytest.fixture(autouse=True)
+def debug_logging(caplog):
+    """Capture log messages down to the debug level for all tests."""
+    caplog.set_level(logging.DEBUG)
+
+
+@pytest.fixture(scope="session")
+def ppms_session_connection():
+    """Establish a connection to a PPMS / PUMAPI instance (once per session)."""
     print(
         "NOTE: some tests require either a *CACHED* response to be present or "
         "valid settings in `pyppmsconf.py` to talk to a real PUMAPI instance."
     )
-    caplog.set_level(logging.DEBUG)
     cache_path = os.path.join(pyppmsconf.CACHE_PATH, "stage_0")
     conn = ppms.PpmsConnection(
         url=pyppmsconf.PUMAPI_URL,
@@ -38,9 +63,67 @@ def ppms_connection(caplog):
     return conn
 
 
+@pytest.fixture
+def ppms_connection(ppms_session_connection):
+    """Provide a pristine copy of the session-wide PPMS connection.
+
+    Tests are modifying the connection object (e.g. by switching the cache path or
+    filling the users / systems dicts), so each one gets its own shallow copy. The
+    (authenticated) HTTP session is shared, avoiding a new handshake for every test.
+    """
+    return pristine_copy(ppms_session_connection)
+
+
+@pytest.fixture(scope="session")
+def ppms_users_connection(ppms_session_connection, ppms_user, ppms_user_admin):
+    """Provide a copy of the session-wide PPMS connection seeded with the test users.
+
+    Seeding the connection's `users` dict happens once per session (served from the
+    on-disk cache), so tests using this fixture must not modify the connection object.
+    """
+    conn = pristine_copy(ppms_session_connection)
+    for login in [ppms_user.username, ppms_user_admin.username]:
+        conn.get_user(login)
+    return conn
+
+
+@pytest.fixture(scope="session")
+def cache_snapshot(tmp_path_factory):
+    """Provide a session-wide copy of the cached responses shipped with the tests.
+
+    The snapshot lives next to the tests' `tmp_path` directories (i.e. on the same
+    file system), so tests requiring a cache they can modify may hard-link the files
+    from here (using `copy_function=os.link`) instead of copying them every time.
+    """
+    snapshot = tmp_path_factory.mktemp("cache_snapshot") / "cached_responses"
+    copytree(pyppmsconf.CACHE_PATH, snapshot)
+    return snapshot
+
+
 ### common helper functions ###
 
 
+def pristine_copy(conn):
+    """Create a shallow copy of a connection having empty users / systems dicts.
+
+    Parameters
+    ----------
+    conn : PpmsConnection
+
+    Returns
+    -------
+    PpmsConnection
+        A copy sharing the (authenticated) HTTP session with the given connection.
+    """
+    conn_copy = copy(conn)
+    conn_copy.status = dict(conn.status)
+    conn_copy.users = {}
+    conn_copy.fullname_mapping = {}
+    conn_copy.systems = {}
+    conn_copy.response_memo = {}
+    return conn_copy
+
+
 def switch_cache_post_change(conn, suffix):
     """Update the connection's cache path to reflect changes to responses.
 
@@ -57,7 +140,7 @@ def switch_cache_post_change(conn, suffix):
     """
     new_path = os.path.join(pyppmsconf.CACHE_PATH, f"stage_{suffix}")
     log.debug("Switching response cache path to reflect a PPMS status change.")
-    log.debug(f"New cache path: [{new_path}]")
+    log.debug("New cache path: [{}]", new_path)
     conn.cache_path = new_path
 
 
@@ -77,11 +160,36 @@ def switch_cache_mocks(conn, mocktype, message="<NOT SPECIFIED>"):
         An explanatory message that will be logged with switching the cache path.
     """
     new_path = os.path.join(pyppmsconf.MOCKS_PATH, mocktype)
-    log.debug(f"Switching response cache path for reason:\n>>> {message} <<<")
-    log.debug(f"New cache path: [{new_path}]")
+    log.debug("Switching response cache path for reason:\n>>> {} <<<", message)
+    log.debug("New cache path: [{}]", new_path)
     conn.cache_path = new_path
 
 
+def seed_cache(src_root, tgt_root, subdirs):
+    """Create request sub-directories in a test-cache, linking the required files.
+
+    Only the files listed in `__KEEP_FILES__` are hard-linked from the source cache,
+    the other sub-directories are just created (empty) as the tests only check for
+    their existence.
+
+    Parameters
+    ----------
+    src_root : pathlib.Path
+        The cache root to link the files from.
+    tgt_root : pathlib.Path
+        The (existing) cache root to create the sub-directories in.
+    subdirs : list(str)
+        The names of the sub-directories to create.
+    """
+    for subdir in subdirs:
+        tgt_path = tgt_root / subdir
+        assert not os.path.exists(tgt_path)
+        tgt_path.mkdir()
+        for filename in __KEEP_FILES__.get(subdir, []):
+            os.link(src_root / subdir / filename, tgt_path / filename)
+        log.info("Created [{}] in [{}]", subdir, tgt_root)
+
+
 def logd(msg, *args):
     """Simple logging wrapper for log messages from test functions."""
     log.debug("\n>>> " + msg, *args)
@@ -96,14 +204,14 @@ def test_ppmsconnection_online(ppms_connection):
     assert ppms_connection.status["auth_state"] == "good"
 
 
-def test_ppmsconnection(ppms_connection, capsys):
+def test_ppmsconnection(ppms_connection):
     """Instantiate a PpmsConnection object in online or offline mode.
 
     NOTE: this test either requires a *CACHED* response to be present or valid
     settings in `pyppmsconf.py` to talk to a real PUMAPI instance.
     """
     auth_state = ppms_connection.status["auth_state"]
-    print(auth_state)
+    logd("Auth state: {}", auth_state)
     assert auth_state in ["good", "NOT_TRIED"]
 
 
@@ -121,62 +229,160 @@ def test_ppmsconnection_fail_online():
         )
 
 
-def test_ppmsconnection_fail(caplog):
-    """Test various ways how establishing a connection could fail."""
-    caplog.set_level(logging.DEBUG)
+def test_ppmsconnection_fail__wrong_url(monkeypatch):
+    """Test establishing a connection to a wrong PUMAPI URL."""
+
+    def refuse_connection(*_args, **_kwargs):
+        """Replacement for sending a request, failing without touching the network."""
+        raise requests.exceptions.ConnectionError("Connection refused (mocked)")
 
-    logd("Testing with a wrong PUMAPI URL")
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", refuse_connection)
     with pytest.raises(requests.exceptions.ConnectionError):
         ppms.PpmsConnection("https://url.example", "dummykey")
 
-    logd("Testing with no API key and no cache path")
-    with pytest.raises(RuntimeError):
-        ppms.PpmsConnection(pyppmsconf.PUMAPI_URL, api_key="", cache="")
 
-    logd("Testing with a mocked auth response containing 'error'")
-    with pytest.raises(requests.exceptions.ConnectionError):
-        ppms.PpmsConnection(
-            pyppmsconf.PUMAPI_URL,
-            api_key="dummykey",
-            cache=os.path.join(pyppmsconf.MOCKS_PATH, "auth_response_contains_error"),
-        )
+@pytest.mark.parametrize(
+    "api_key,cache,exception",
+    [
+        # no API key and no cache path:
+        ("", "", RuntimeError),
+        # mocked auth response containing 'error':
+        (
+            "dummykey",
+            os.path.join(pyppmsconf.MOCKS_PATH, "auth_response_contains_error"),
+            requests.exceptions.ConnectionError,
+        ),
+        # mocked auth response having a non-standard response code:
+        (
+            "dummykey",
+            os.path.join(pyppmsconf.MOCKS_PATH, "auth_wrong_status_code"),
+            requests.exceptions.ConnectionError,
+        ),
+    ],
+)
+def test_ppmsconnection_fail(api_key, cache, exception):
+    """Test various ways how establishing a connection could fail."""
+    with pytest.raises(exception):
+        ppms.PpmsConnection(pyppmsconf.PUMAPI_URL, api_key=api_key, cache=cache)
+
+
+def test_request__memoize(ppms_connection):
+    """Test re-using memoized responses of read-only requests."""
+    ppms_connection.memoize = True
+    params = {"login": "pyppms"}
+
+    response = ppms_connection.request("getuser", params)
+    assert ppms_connection.request("getuser", params) is response
+    assert ppms_connection.last_served_from_cache
+
+    logd("Checking that bookings are not memoized")
+    ppms_connection.request("nextbooking", {"id": __SYS_ID__})
+    assert len(ppms_connection.response_memo) == 1
+
+    logd("Running a request modifying PPMS for another system, expecting no changes")
+    ppms_connection.request("getsysrights", {"id": __SYS_ID__})
+    assert len(ppms_connection.response_memo) == 2
+    ppms_connection.request("setright", {"id": 0, "login": "pyppms", "type": "A"})
+    assert len(ppms_connection.response_memo) == 2
+
+    logd("Running a request modifying PPMS, expecting affected entries to be dropped")
+    setright = {"id": __SYS_ID__, "login": "invalidlogin", "type": "A"}
+    ppms_connection.request("setright", setright)
+    assert list(ppms_connection.response_memo) == [("getuser", (("login", "pyppms"),))]
+    assert ppms_connection.request("getuser", params) is response
+
+    logd("Creating a user in a new group, expecting the list of groups to be dropped")
+    ppms_connection.request("getgroups")
+    ppms_connection.request("getgroup", {"unitlogin": "pyppms_group"})
+    assert len(ppms_connection.response_memo) == 3
+    switch_cache_mocks(ppms_connection, "newuser_new_group")
+    newuser = {
+        "login": "pyppms-new",
+        "lname": "PyPPMS",
+        "fname": "New",
+        "email": "pyppms-new@python-facility.example",
+        "unitlogin": "pyppms_new_group",
+    }
+    ppms_connection.request("newuser", newuser)
+    assert ("getgroups", ()) not in ppms_connection.response_memo
+    # responses for other users / groups are not affected:
+    assert len(ppms_connection.response_memo) == 2
+
+
+def test_request__memoize_ttl(ppms_connection, monkeypatch):
+    """Test expiring memoized responses."""
+    clock = [1000.0]
+    monkeypatch.setattr(ppms, "monotonic", lambda: clock[0])
+    ppms_connection.memoize = True
+    ppms_connection.memo_ttl = 60
+    params = {"login": "pyppms"}
+
+    response = ppms_connection.request("getuser", params)
+    clock[0] += 59
+    assert ppms_connection.request("getuser", params) is response
+
+    logd("Advancing the clock beyond the TTL, expecting a new response")
+    clock[0] += 1
+    assert ppms_connection.request("getuser", params) is not response
+
+
+def test_request__memoize_force_refresh(ppms_connection, monkeypatch):
+    """Test refreshing systems and users on a memoizing connection."""
+    ppms_connection.memoize = True
+
+    logd("Checking that systems are not memoized (they are kept in `systems`)")
+    ppms_connection.get_systems()
+    assert ("getsystems", ()) not in ppms_connection.response_memo
 
-    logd("Testing with a mocked auth response having a non-standard response code")
-    with pytest.raises(requests.exceptions.ConnectionError):
-        ppms.PpmsConnection(
-            pyppmsconf.PUMAPI_URL,
-            api_key="dummykey",
-            cache=os.path.join(pyppmsconf.MOCKS_PATH, "auth_wrong_status_code"),
-        )
-    # assert 0
+    # avoid requesting the details of all users (done with `skip_cache=True`):
+    monkeypatch.setattr(ppms_connection, "get_user", lambda *_args, **_kwargs: None)
+    key = ("getusers", (("active", "true"),))
+    ppms_connection.get_user_ids(active=True)
+    memoized = ppms_connection.response_memo[key][1]
+    ppms_connection.get_users()
+    assert ppms_connection.response_memo[key][1] is memoized
+    ppms_connection.get_users(force_refresh=True)
+    assert ppms_connection.response_memo[key][1] is not memoized
+
+
+def test_request__memoize_flush_cache(ppms_connection):
+    """Test that flushing the cache also drops the memoized responses."""
+    ppms_connection.memoize = True
+    ppms_connection.request("getuser", {"login": "pyppms"})
+    ppms_connection.request("getusers")
+    assert len(ppms_connection.response_memo) == 2
+
+    ppms_connection.cache_path = ""  # keep the on-disk cache of the repository
+
+    ppms_connection.flush_cache(keep_users=True)
+    assert ppms_connection.response_memo == {}
 
 
 ############ users / groups ############
 
 
-def test_get_user_ids(ppms_connection):
+@pytest.mark.parametrize("active", [False, True])
+def test_get_user_ids(ppms_connection, active):
     """Test getting a list of user IDs from PPMS."""
-    users = ppms_connection.get_user_ids(active=False)
-    print(users)
-    assert "pyppms" in users
-
-    users = ppms_connection.get_user_ids(active=True)
-    print(users)
+    users = ppms_connection.get_user_ids(active=active)
+    logd("User IDs: {}", users)
     assert "pyppms" in users
 
 
-def test_get_user_dict(ppms_connection, user_details_raw, user_admin_details_raw):
+@pytest.mark.parametrize(
+    "login,expected_fixture",
+    [("pyppms", "user_details_raw"), ("pyppms-adm", "user_admin_details_raw")],
+)
+def test_get_user_dict(ppms_connection, request, login, expected_fixture):
     """Test fetching details of a specific user."""
-    print(f"Expected dict data: {user_details_raw}")
-    details = ppms_connection.get_user_dict("pyppms")
-    print(f"Retrieved dict data: {details}")
-    assert user_details_raw == details
+    expected = request.getfixturevalue(expected_fixture)
+    details = ppms_connection.get_user_dict(login)
+    logd("Retrieved dict data: {}", details)
+    assert expected == details
 
-    print(f"Expected dict data: {user_admin_details_raw}")
-    details = ppms_connection.get_user_dict("pyppms-adm")
-    print(f"Retrieved dict data: {details}")
-    assert user_admin_details_raw == details
 
+def test_get_user_dict__invalid(ppms_connection):
+    """Test fetching details of a non-existing user."""
     with pytest.raises(KeyError):
         ppms_connection.get_user_dict("invalidlogin")
 
@@ -184,128 +390,116 @@ def test_get_user_dict(ppms_connection, user_details_raw, user_admin_details_raw
 def test_get_groups(ppms_connection):
     """Test getting a list of group IDs ("unitlogin") from PPMS."""
     groups = ppms_connection.get_groups()
-    print(groups)
+    logd("Groups: {}", groups)
     assert "pyppms_group" in groups
 
 
 def test_get_group(ppms_connection, group_details):
     """Test fetching details of a specific group."""
-    print(f"Expected dict data (subset): {group_details}")
+    logd("Expected dict data (subset): {}", group_details)
     details = ppms_connection.get_group("pyppms_group")
-    print(f"Retrieved dict data: {details}")
-    for key in group_details.keys():
-        assert group_details[key] == details[key]
+    logd("Retrieved dict data: {}", details)
+    assert group_details.items() <= details.items()
 
     with pytest.raises(KeyError):
         ppms_connection.get_group("invalid-unitlogin")
 
 
-def test_get_user(ppms_connection, ppms_user, ppms_user_admin):
+@pytest.mark.parametrize(
+    "login,expected_fixture",
+    [("pyppms", "ppms_user"), ("pyppms-adm", "ppms_user_admin")],
+)
+def test_get_user(ppms_connection, request, login, expected_fixture):
     """Test the get_user() method."""
-    user = ppms_connection.get_user("pyppms")
-    print(user.details())
-    print(ppms_user.details())
-    assert user.details() == ppms_user.details()
+    expected = request.getfixturevalue(expected_fixture)
+    details = ppms_connection.get_user(login).details()
+    logd("Retrieved user details: {}", details)
+    assert details == expected.details()
 
-    user = ppms_connection.get_user("pyppms-adm")
-    print(user.details())
-    print(ppms_user_admin.details())
-    assert user.details() == ppms_user_admin.details()
 
+def test_get_user__invalid(ppms_connection):
+    """Test the get_user() method with a non-existing user."""
     with pytest.raises(KeyError):
         ppms_connection.get_user("invalidlogin")
 
 
-def test_get_users(ppms_connection, ppms_user, ppms_user_admin):
+def test_get_users(ppms_users_connection, ppms_user, ppms_user_admin):
     """Test the get_users() method."""
-    testusers = [ppms_user, ppms_user_admin]
-    testusers_logins = [x.username for x in testusers]
-
-    logd(
-        "Requesting users without pre-seeding the connection (WARNING: very "
-        "time-consuming when no cache is present!)"
-    )
-    ppms_connection.get_users()
-
-    logd("Adding users to the connection to avoid the requesting step")
-    ppms_connection.update_users(user_ids=testusers_logins)
-
     logd("Asking the connection for the (pre-seeded / cached) users:")
-    users = ppms_connection.get_users()
+    users = ppms_users_connection.get_users()
 
     # check if the references match:
-    for testuser in testusers:
+    for testuser in [ppms_user, ppms_user_admin]:
         username = users[testuser.username].username
-        print(username)
         assert testuser.username == username
         email = users[testuser.username].email
-        print(email)
         assert testuser.email == email
         fullname = users[testuser.username].fullname
         assert testuser.fullname == fullname
-        print(f"{username}: {email} ({fullname})")
+        logd("{}: {} ({})", username, email, fullname)
 
         # check if the fullname_mapping has been updated correctly:
-        assert fullname in ppms_connection.fullname_mapping
-        assert ppms_connection.fullname_mapping[fullname] == testuser.username
+        assert fullname in ppms_users_connection.fullname_mapping
+        assert ppms_users_connection.fullname_mapping[fullname] == testuser.username
 
 
 @pytest.mark.online
-def test_get_user__skip_cache(caplog, ppms_connection, ppms_user):
+def test_get_users__unseeded(ppms_connection, ppms_user, ppms_user_admin):
+    """Test the get_users() method on a connection without any users yet.
+
+    This requests the details of *all* active users from PUMAPI (WARNING: very
+    time-consuming on instances with many users!).
+    """
+    assert not ppms_connection.users
+    users = ppms_connection.get_users()
+    logd("Received details on {} users", len(users))
+
+    for testuser in [ppms_user, ppms_user_admin]:
+        assert users[testuser.username].details() == testuser.details()
+        mapping = ppms_connection.fullname_mapping
+        assert mapping[testuser.fullname] == testuser.username
+
+
+@pytest.mark.online
+def test_get_user__skip_cache(caplog, ppms_connection, ppms_user, tmp_path):
     """Test if the `skip_cache` parameter has the desired effect.
 
     Steps:
 
-    - switch to a test-specific cache location, make sure it's empty
+    - switch to an (empty) test-specific cache location
     - request a user, check if this results in an on-line request
     - check if the user request has been cached locally
     - request the same user again, check if it is served from the cache
     - request the same user again now setting the `skip_cache` parameter to True, check
       if this results in an on-line request despite the cache is present
     """
-    # switch to a test-specific cache location:
-    switch_cache_post_change(ppms_connection, "test_get_users__forcerefresh")
-    # wipe the cache
-    rmtree(ppms_connection.cache_path, ignore_errors=True)
-    cached = ppms_connection.cache_path + "/getuser/login--pyppms.txt"
-    assert os.path.exists(cached) is False
-
-    ppms_connection.get_user(ppms_user.username)
-    assert ppms_connection.last_served_from_cache is False
-    assert "Read intercepted response text from" not in caplog.text
 
-    assert os.path.exists(cached) is True
+    def assert_served(from_cache, **kwargs):
+        """Request the test user, check where the response has been served from."""
+        caplog.clear()
+        ppms_connection.get_user(ppms_user.username, **kwargs)
+        assert ppms_connection.last_served_from_cache is from_cache
+        assert ("Read intercepted response text from" in caplog.text) is from_cache
 
-    caplog.clear()
-    ppms_connection.get_user(ppms_user.username)
-    assert ppms_connection.last_served_from_cache is True
-    assert "Read intercepted response text from" in caplog.text
-
-    caplog.clear()
-    ppms_connection.get_user(ppms_user.username, skip_cache=True)
-    assert ppms_connection.last_served_from_cache is False
-    assert "Read intercepted response text from" not in caplog.text
+    # switch to a test-specific cache location:
+    ppms_connection.cache_path = str(tmp_path / "skipcache")
+    cached = tmp_path / "skipcache" / "getuser" / "login--pyppms.txt"
+    assert not cached.exists()
 
-    # make sure to clean up the test-specific cache again:
-    rmtree(ppms_connection.cache_path, ignore_errors=True)
+    assert_served(from_cache=False)
+    assert cached.exists()
+    assert_served(from_cache=True)
+    assert_served(from_cache=False, skip_cache=True)
 
 
 def test_get_admins(ppms_connection, ppms_user_admin):
     """Test the get_admins() method."""
-    admins = ppms_connection.get_admins()
-
-    usernames = []
-    admin_user = None
-    for admin in admins:
-        usernames.append(admin.username)
-        if admin.username == "pyppms-adm":
-            admin_user = admin
+    admins = {admin.username: admin for admin in ppms_connection.get_admins()}
+    assert "pyppms-adm" in admins
 
-    print(usernames)
-    assert "pyppms-adm" in usernames
-
-    print(admin_user.details())
-    assert admin_user.details() == ppms_user_admin.details()
+    details = admins["pyppms-adm"].details()
+    logd("Admin user details: {}", details)
+    assert details == ppms_user_admin.details()
 
 
 def test_get_group_users(ppms_connection, ppms_user, ppms_user_admin):
@@ -313,17 +507,16 @@ def test_get_group_users(ppms_connection, ppms_user, ppms_user_admin):
     # TODO: that's certainly not the nicest test, it really needs to be
     # refactored once the get_group_users() method returns a dict instead of a
     # list of user objects!
+    checks = {
+        "pyppms": lambda user: user.details() == ppms_user.details(),
+        "pyppms-adm": lambda user: user.details() == ppms_user_admin.details(),
+        "pyppms-deact": lambda user: not user.active,
+    }
     members = ppms_connection.get_group_users("pyppms_group")
     for user in members:
-        print(user.details())
-        if user.username == "pyppms":
-            assert user.details() == ppms_user.details()
-        elif user.username == "pyppms-adm":
-            assert user.details() == ppms_user_admin.details()
-        elif user.username == "pyppms-deact":
-            assert not user.active
-        else:
-            raise KeyError(f"Unexpected username: {user.username}")
+        logd("Group member: {}", user)
+        # an unexpected username will raise a KeyError here:
+        assert checks[user.username](user)
 
     assert ppms_connection.get_group_users("") == []
 
@@ -336,16 +529,12 @@ def test_get_user_experience(ppms_connection):
 
     # check if a user has access to a specific system:
     systems = ppms_connection.get_user_experience(login="pyppms")
-    sys_ids = []
-    for system in systems:
-        sys_ids.append(system["id"])
+    sys_ids = {system["id"] for system in systems}
     assert str(__SYS_ID__) in sys_ids
 
     # check if a system is having a specific user with permission to access it:
     users = ppms_connection.get_user_experience(system_id=__SYS_ID__)
-    usernames = []
-    for user in users:
-        usernames.append(user["login"])
+    usernames = {user["login"] for user in users}
     assert "pyppms" in usernames
 
     # check if filtering for user *and* system results in exactly one entry:
@@ -356,24 +545,23 @@ def test_get_users_emails(
     ppms_connection, user_details_raw, user_admin_details_raw, caplog
 ):
     """Test the get_users_emails() method."""
-    # caplog.set_level(logging.DEBUG)
     logd("Testing users=None (WARNING: very time-consuming when no cache is present!)")
     ppms_connection.get_users_emails(users=None, active=True)
 
     logd("Testing with specific users")
     users = [user_details_raw["login"], user_admin_details_raw["login"]]
-    print(f"users: {users}")
-    emails = ppms_connection.get_users_emails(users)
-    print(f"emails: {emails}")
+    logd("Users: {}", users)
+    emails = set(ppms_connection.get_users_emails(users))
+    logd("Emails: {}", emails)
     assert user_details_raw["email"] in emails
     assert user_admin_details_raw["email"] in emails
 
     logd("Testing with mock-response where some users have no email")
     switch_cache_mocks(ppms_connection, "get_users_emails__no_email")
-    emails = ppms_connection.get_users_emails(users)
+    emails = set(ppms_connection.get_users_emails(users))
     raw_email = user_details_raw["email"]
     raw_login = user_details_raw["login"]
-    print(f"address [{raw_email}] expected to NOT be in {emails}")
+    logd("Address [{}] expected to NOT be in {}", raw_email, emails)
     assert raw_email not in emails
     assert f"no email for user [{raw_login}]" in caplog.text
     assert user_admin_details_raw["email"] in emails
@@ -389,25 +577,23 @@ def test_get_systems(ppms_connection, system_details_raw):
     # check if we got some systems after all:
     assert len(systems) > 0
 
-    print(system_details_raw)
+    logd("Expected system details: {}", system_details_raw)
 
     found = systems[int(system_details_raw["System id"])]
-    print(f"Found system: {found}")
+    logd("Found system: {}", found)
 
     assert found.system_id == int(system_details_raw["System id"])
     assert found.localisation == system_details_raw["Localisation"]
     assert found.system_type == system_details_raw["Type"]
 
-    # test refreshing the systems cache:
-    systems = ppms_connection.get_systems(force_refresh=True)
 
-    # check if we got some systems after all:
-    assert len(systems) > 0
+def test_get_systems__force_refresh(ppms_connection):
+    """Test refreshing the systems cache through the get_systems() method."""
+    assert len(ppms_connection.get_systems(force_refresh=True)) > 0
 
 
-def test_update_systems(ppms_connection, caplog):
+def test_update_systems(ppms_connection):
     """Test the get_systems() method."""
-    caplog.set_level(logging.DEBUG)
     switch_cache_mocks(ppms_connection, "update_systems__broken_id")
     assert len(ppms_connection.systems) == 0
     ppms_connection.get_systems()
@@ -415,26 +601,27 @@ def test_update_systems(ppms_connection, caplog):
     assert len(ppms_connection.systems) == 1
 
 
-def test_get_systems_matching(ppms_connection, system_details_raw):
+@pytest.mark.parametrize(
+    "loc,names,expected",
+    [
+        (
+            __SYSTEM__["Localisation"][:3],
+            [__SYSTEM__["Name"][:6]],
+            [int(__SYSTEM__["System id"])],
+        ),
+        (
+            __SYSTEM__["Localisation"],
+            [__SYSTEM__["Name"]],
+            [int(__SYSTEM__["System id"])],
+        ),
+        ("__non_existing__", [__SYSTEM__["Name"]], []),
+        (__SYSTEM__["Localisation"], ["__non_existing__"], []),
+    ],
+    ids=["partial", "full", "non-existing-localisation", "non-existing-name"],
+)
+def test_get_systems_matching(ppms_connection, loc, names, expected):
     """Test the get_systems_matching() method."""
-    loc = system_details_raw["Localisation"]
-    name = system_details_raw["Name"]
-
-    # test with partial matches
-    sys_ids = ppms_connection.get_systems_matching(loc[:3], [name[:6]])
-    assert sys_ids == [int(system_details_raw["System id"])]
-
-    # test with full matches
-    sys_ids = ppms_connection.get_systems_matching(loc, [name])
-    assert sys_ids == [int(system_details_raw["System id"])]
-
-    # test with non-existing localisation
-    sys_ids = ppms_connection.get_systems_matching("__non_existing__", [name])
-    assert sys_ids == []
-
-    # test with non-existing name
-    sys_ids = ppms_connection.get_systems_matching(loc, ["__non_existing__"])
-    assert sys_ids == []
+    assert ppms_connection.get_systems_matching(loc, names) == expected
 
 
 def test_get_systems_matching__raises(ppms_connection, system_details_raw):
@@ -459,7 +646,7 @@ def test_get_users_with_access_to_system(
 
     logd("Testing 'getsysrights' for specific users on a fixed system")
     allowed_users = ppms_connection.get_users_with_access_to_system(sys_id)
-    print(allowed_users)
+    logd("Allowed users: {}", allowed_users)
     assert username in allowed_users
     assert username_adm in allowed_users
 
@@ -503,7 +690,7 @@ def test_user_access_to_system(ppms_connection, system_details_raw, user_details
 
     logd("Testing if the user is in the list of allowed ones (should NOT be)")
     allowed_users = ppms_connection.get_users_with_access_to_system(sys_id)
-    print(allowed_users)
+    logd("Allowed users: {}", allowed_users)
     assert username not in allowed_users
 
     logd("Testing to restore permissions of the user to book the system")
@@ -513,15 +700,15 @@ def test_user_access_to_system(ppms_connection, system_details_raw, user_details
 
     logd("Testing again if the user is in the list of allowed ones (should be now)")
     allowed_users = ppms_connection.get_users_with_access_to_system(sys_id)
-    print(allowed_users)
+    logd("Allowed users: {}", allowed_users)
     assert username in allowed_users
 
 
 ############ bookings ############
 
 
-def test_get_booking(ppms_connection, system_details_raw):
-    """Test the get_booking() method.
+def test_get_booking__next(ppms_connection, system_details_raw):
+    """Test the get_booking() method for the next booking.
 
     Raises
     ------
@@ -529,22 +716,7 @@ def test_get_booking(ppms_connection, system_details_raw):
         Raised in case no booking in PPMS could be found so one can be created
         manaully (the API doesn't provide a way to do this).
     """
-    # test with a non-existing system ID:
-    sys_id = 0
-    assert ppms_connection.get_booking(sys_id) is None
-
-    # test with an invalid system ID (string):
-    sys_id = "invalid-id"
-    assert ppms_connection.get_booking(sys_id) is None
-
     sys_id = system_details_raw["System id"]
-    # try to get the current booking, usually this will be None, but it depends
-    # on the system state in PPMS, so we don't assert any result here but rather
-    # run the code to see if it raises any exception (which it shouldn't)
-    ppms_connection.get_booking(sys_id)
-    # do the same using the get_current_booking() wrapper:
-    ppms_connection.get_current_booking(sys_id)
-
     # this is a difficult one: in best case we would be able to create a
     # booking in PPMS, but the PUMAPI doesn't provide a way to do this - so the
     # only reasonable thing to do is to check if the 'next' booking is None and
@@ -561,8 +733,28 @@ def test_get_booking(ppms_connection, system_details_raw):
     booking = ppms_connection.get_next_booking(sys_id)
     assert booking.system_id == int(sys_id)
 
+
+def test_get_booking__current(ppms_connection, system_details_raw):
+    """Test the get_booking() method for the current booking."""
+    sys_id = system_details_raw["System id"]
+    # try to get the current booking, usually this will be None, but it depends
+    # on the system state in PPMS, so we don't assert any result here but rather
+    # run the code to see if it raises any exception (which it shouldn't)
+    ppms_connection.get_booking(sys_id)
+    # do the same using the get_current_booking() wrapper:
+    ppms_connection.get_current_booking(sys_id)
+
+
+@pytest.mark.parametrize("sys_id", [0, "invalid-id"])
+def test_get_booking__invalid_id(ppms_connection, sys_id):
+    """Test the get_booking() method with a non-existing / invalid system ID."""
+    assert ppms_connection.get_booking(sys_id) is None
+
+
+def test_get_booking__invalid_type(ppms_connection, system_details_raw):
+    """Test the get_booking() method with an invalid booking type."""
     with pytest.raises(ValueError):
-        ppms_connection.get_booking(sys_id, booking_type="invalid")
+        ppms_connection.get_booking(system_details_raw["System id"], "invalid")
 
 
 def test_get_running_sheet(ppms_connection, system_details_raw):
@@ -575,94 +767,42 @@ def test_get_running_sheet(ppms_connection, system_details_raw):
 
     Still not quite optimal though.
     """
-    # take an arbitrary date long time in the future (unfortunately the web interface
-    # of PPMS doesn't let us go much beyond 10 years from now):
-    date = "2028-12-24"
-    # that day is expected to have four 60-minute-bookings, starting at the full hour:
-    sessions_start = [9, 11, 13, 15]
-    # use the start times to assemble a list of datetime tuples with start and end time
-    # of the sessions on that day:
-    sessions = []
-    for shour in sessions_start:
-        ehour = shour + 1
-        sessions.append(
-            [
-                datetime.strptime(f"{date}T{shour}", r"%Y-%m-%dT%H"),
-                datetime.strptime(f"{date}T{ehour}", r"%Y-%m-%dT%H"),
-            ]
-        )
-    # hard-coding the list would look like this:
-    # pylint: disable-msg=pointless-string-statement
-    """Example:
-    >>> sessions = [
-    ...     [datetime(2028, 12, 24, 9, 0), datetime(2028, 12, 24, 10, 0)],
-    ...     [datetime(2028, 12, 24, 11, 0), datetime(2028, 12, 24, 12, 0)],
-    ...     [datetime(2028, 12, 24, 13, 0), datetime(2028, 12, 24, 14, 0)],
-    ...     [datetime(2028, 12, 24, 15, 0), datetime(2028, 12, 24, 16, 0)],
-    ... ]
-    """
-
-    def find_endtime(session_times, start_time):
-        """Scan a list of tuples for the first elements, return the second on match.
-
-        Parameters
-        ----------
-        session_times : list([datetime.datetime, datetime.datetime])
-            A list of tuples of datetime objects.
-        start_time : datetime.datetime
-            The datetime object to be matched against the first element of the tuples.
-
-        Returns
-        -------
-        datetime.datetime or None
-            The second element of the first matching tuple, None when nothing matches.
-        """
-        for times in session_times:
-            if start_time == times[0]:
-                return times[1]
-        return None
-
-    day = datetime.strptime(date, r"%Y-%m-%d")
-
-    logd("Testing runningsheet details for {}", date)
-    for booking in ppms_connection.get_running_sheet("2", date=day):
+    logd("Testing runningsheet details for {}", __RS_DAY__)
+    for booking in ppms_connection.get_running_sheet("2", date=__RS_DAY__):
         assert booking.system_id == int(system_details_raw["System id"])
-        endtime = find_endtime(sessions, booking.starttime)
+        endtime = __RS_SESSIONS__.get(booking.starttime)
         assert endtime is not None
-        print(f"matching booking end time: {endtime}")
+        logd("Matching booking end time: {}", endtime)
         assert booking.endtime == endtime
-        print(str(booking))
+        logd("Booking: {}", booking)
 
     logd("Testing fullname that cannot be mapped to a user")
     switch_cache_mocks(ppms_connection, "runningsheet_single_unknown_fullname")
-    assert len(ppms_connection.get_running_sheet("2", date=day)) == 2
+    assert len(ppms_connection.get_running_sheet("2", date=__RS_DAY__)) == 2
 
 
 def test_get_running_sheet_fail(ppms_connection):
     """Test cases where no runningsheet can be assembled from the responses."""
-    date = "2028-12-24"
-    day = datetime.strptime(date, r"%Y-%m-%d")
-
     switch_cache_mocks(
         ppms_connection,
         "runningsheet_key_error",
         "Testing with mock-response that is missing the key 'User'",
     )
     with pytest.raises(KeyError):
-        ppms_connection.get_running_sheet("2", date=day)
+        ppms_connection.get_running_sheet("2", date=__RS_DAY__)
 
     switch_cache_mocks(
         ppms_connection,
         "runningsheet_invalid_multiline_response",
         "using mock that fails parsing, expected result is an empty list of bookings",
     )
-    assert ppms_connection.get_running_sheet("2", date=day) == []
+    assert ppms_connection.get_running_sheet("2", date=__RS_DAY__) == []
 
 
 ############ cache ############
 
 
-def test_flush_cache(ppms_connection, caplog, tmp_path):
+def test_flush_cache(ppms_connection, tmp_path, cache_snapshot):
     """Test flushing the on-disk PyPPMS cache.
 
     - Make sure the temporary test-directory exists but doesn't contain a cache yet.
@@ -672,33 +812,33 @@ def test_flush_cache(ppms_connection, caplog, tmp_path):
     - Trigger the `flush_cache()` method.
     - Verify the cache has been removed from the test-directory.
     """
-    orig_cache_path = os.path.join(pyppmsconf.CACHE_PATH, "stage_1")
+    orig_cache_path = cache_snapshot / "stage_1"
     fresh_cache_path = tmp_path / "pyppms_cache"
 
     assert os.path.exists(tmp_path)
     assert os.path.exists(orig_cache_path)
 
     assert not os.path.exists(fresh_cache_path)
-    copytree(orig_cache_path, fresh_cache_path)
+    copytree(orig_cache_path, fresh_cache_path, copy_function=os.link)
     assert os.path.exists(fresh_cache_path)
-    log.info(f"Cache path created: {fresh_cache_path}")
+    log.info("Cache path created: {}", fresh_cache_path)
 
     ppms_connection.cache_path = fresh_cache_path
-    log.info(f"Updated connection cache path: {fresh_cache_path}")
+    log.info("Updated connection cache path: {}", fresh_cache_path)
     ppms_connection.flush_cache()
-    log.info(f"Flushed connection cache path: {fresh_cache_path}")
+    log.info("Flushed connection cache path: {}", fresh_cache_path)
     assert not os.path.exists(fresh_cache_path)
 
 
-def test_flush_cache__keep_users(ppms_connection, caplog, tmp_path):
+def test_flush_cache__keep_users(ppms_connection, tmp_path, cache_snapshot):
     """Test flushing the on-disk PyPPMS cache while keeping the user details.
 
     - Make sure the temporary test-directory exists but doesn't contain a cache yet.
     - Create the cache directory there.
     - Update the connection object's `cache_path` to point to the test location.
-    - Copy over the subdirs listed in `to_keep` and `to_flush` from the cache provided
-      with the tests.
-    - Make sure the copied directories exist at the test-cache location.
+    - Create the subdirs listed in `to_keep` and `to_flush` at the test-cache location
+      (linking the files listed in `__KEEP_FILES__` from the cache provided with the
+      tests).
     - Trigger the `flush_cache(keep_users=True)` method.
     - Verify the subdirs in `to_keep` have been retained at the test-directory.
     - Verify the subdirs in `to_flush` have been removed from the test-directory.
@@ -706,7 +846,7 @@ def test_flush_cache__keep_users(ppms_connection, caplog, tmp_path):
     to_keep = ["getuser"]
     to_flush = ["auth", "getgroups", "getusers", "getbooking"]
 
-    orig_cache_root = os.path.join(pyppmsconf.CACHE_PATH, "stage_0")
+    orig_cache_root = cache_snapshot / "stage_0"
     fresh_cache_path = tmp_path / "pyppms_cache"
 
     assert os.path.exists(tmp_path)
@@ -715,34 +855,30 @@ def test_flush_cache__keep_users(ppms_connection, caplog, tmp_path):
     assert not os.path.exists(fresh_cache_path)
     fresh_cache_path.mkdir()
     assert os.path.exists(fresh_cache_path)
-    log.info(f"Cache path created: {fresh_cache_path}")
+    log.info("Cache path created: {}", fresh_cache_path)
 
     ppms_connection.cache_path = fresh_cache_path
-    log.info(f"Updated connection cache path: {fresh_cache_path}")
+    log.info("Updated connection cache path: {}", fresh_cache_path)
 
-    for subdir in to_keep + to_flush:
-        srcdir = os.path.join(orig_cache_root, subdir)
-        tgt_path = fresh_cache_path / subdir
-        assert not os.path.exists(tgt_path)
-        copytree(srcdir, tgt_path)
-        log.info(f"Copied [{subdir}] to [{tgt_path}]")
-        assert os.path.exists(tgt_path)
+    seed_cache(orig_cache_root, fresh_cache_path, to_keep + to_flush)
 
     ppms_connection.flush_cache(keep_users=True)
 
     for subdir in to_keep:
         tgt_path = fresh_cache_path / subdir
-        log.debug(f"Verifying directory has been KEPT: {tgt_path}")
+        log.debug("Verifying directory has been KEPT: {}", tgt_path)
         assert os.path.exists(tgt_path)
 
     for subdir in to_flush:
         tgt_path = fresh_cache_path / subdir
-        log.debug(f"Verifying directory has been FLUSHED: {tgt_path}")
+        log.debug("Verifying directory has been FLUSHED: {}", tgt_path)
         assert not os.path.exists(tgt_path)
 
 
 @pytest.mark.online
-def test_flush_cache__keep_users__request_new(ppms_connection, caplog, tmp_path):
+def test_flush_cache__keep_users__request_new(
+    ppms_connection, caplog, tmp_path, cache_snapshot
+):
     """Test flush_cache() with `keep_users=True` and request a new user after.
 
     This test has a huge overlap to the `test_flush_cache__keep_users()` one
@@ -756,8 +892,8 @@ def test_flush_cache__keep_users__request_new(ppms_connection, caplog, tmp_path)
     - Make sure the temporary test-directory exists and has no cache inside.
     - Create the cache directory there.
     - Update the connection object's `cache_path` to point to the test location.
-    - Copy over the subdirs listed in `to_keep` and `to_flush` from the cache
-      provided with the tests.
+    - Create the subdirs listed in `to_keep` and `to_flush`, linking the files
+      listed in `__KEEP_FILES__` from the cache provided with the tests.
     - Trigger the `flush_cache(keep_users=True)` method.
     - Simulate a new user in PPMS that is not yet cached locally:
       - Remove a specific file of previously cached user details from the
@@ -774,7 +910,7 @@ def test_flush_cache__keep_users__request_new(ppms_connection, caplog, tmp_path)
     to_keep = ["getuser"]
     to_flush = ["auth", "getgroups", "getusers", "getbooking"]
 
-    orig_cache_root = os.path.join(pyppmsconf.CACHE_PATH, "stage_0")
+    orig_cache_root = cache_snapshot / "stage_0"
     fresh_cache_path = tmp_path / "pyppms_cache"
 
     assert os.path.exists(orig_cache_root)
@@ -782,45 +918,38 @@ def test_flush_cache__keep_users__request_new(ppms_connection, caplog, tmp_path)
     assert not os.path.exists(fresh_cache_path)
     fresh_cache_path.mkdir()
     assert os.path.exists(fresh_cache_path)
-    log.info(f"Cache path created: {fresh_cache_path}")
+    log.info("Cache path created: {}", fresh_cache_path)
 
     ppms_connection.cache_path = fresh_cache_path
-    log.info(f"Updated connection cache path: {fresh_cache_path}")
+    log.info("Updated connection cache path: {}", fresh_cache_path)
 
-    for subdir in to_keep + to_flush:
-        srcdir = os.path.join(orig_cache_root, subdir)
-        tgt_path = fresh_cache_path / subdir
-        assert not os.path.exists(tgt_path)
-        copytree(srcdir, tgt_path)
-        log.info(f"Copied [{subdir}] to [{tgt_path}]")
-        assert os.path.exists(tgt_path)
+    seed_cache(orig_cache_root, fresh_cache_path, to_keep + to_flush)
 
     ppms_connection.flush_cache(keep_users=True)
 
     new_user_name = "pyppms-adm"  # simulated "new" user
     old_user_name = "pyppms"  # previously existing, cached user (preserved)
 
-    log.info(f"Removing preserved user-cache for [{new_user_name}]...")
+    log.info("Removing preserved user-cache for [{}]...", new_user_name)
     new_user_cache = fresh_cache_path / "getuser" / f"login--{new_user_name}.txt"
     old_user_cache = fresh_cache_path / "getuser" / f"login--{old_user_name}.txt"
-    assert os.path.isfile(new_user_cache)
-    os.unlink(new_user_cache)
-    assert not os.path.exists(new_user_cache)
-    assert os.path.exists(old_user_cache)
+    # unlinking fails with a FileNotFoundError in case the file doesn't exist:
+    new_user_cache.unlink()
+    assert old_user_cache.exists()
 
     log.info("Restoring cache of existing user names...")
     users_list = os.path.join(orig_cache_root, "getusers")
     tgt_path = fresh_cache_path / "getusers"
-    copytree(users_list, tgt_path)
+    copytree(users_list, tgt_path, copy_function=os.link)
     assert os.path.exists(tgt_path)
-    log.info(f"Restored user names cache to [{tgt_path}].")
+    log.info("Restored user names cache to [{}].", tgt_path)
 
-    log.info(f"Requesting details from PUMAPI for cached user [{old_user_name}]")
+    log.info("Requesting details from PUMAPI for cached user [{}]", old_user_name)
     ppms_connection.get_user(old_user_name)
     assert ppms_connection.last_served_from_cache is True
     # assert "No cache hit" not in caplog.text  # served from the cache
 
-    log.info(f"Requesting details from PUMAPI for 'new' user [{new_user_name}]")
+    log.info("Requesting details from PUMAPI for 'new' user [{}]", new_user_name)
     ppms_connection.get_user(new_user_name)
     assert ppms_connection.last_served_from_cache is False
     # assert "No cache hit" in caplog.text  # requires an on-line request
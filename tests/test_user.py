@@ -10,3 +10,11 @@ def test_user_details(user_details, ppms_user):
     print(user_details["expected"])
     print(ppms_user.details())
     assert ppms_user.details() == user_details["expected"]
+
+
+def test_user_attributes(user_details_raw, ppms_user):
+    """Test the PpmsUser attributes against the configured user details."""
+    assert ppms_user.username == user_details_raw["login"]
+    assert ppms_user.email == user_details_raw["email"]
+    assert ppms_user.ppms_group == user_details_raw["unitlogin"]
+    assert ppms_user.active is True